@@ -1,16 +1,716 @@
+import hashlib
 import logging
+import math
+import os
+import re
 import requests
-from pilmoji import Pilmoji
+from cachecontrol import CacheControlAdapter
+from cachecontrol.caches import FileCache
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import accumulate
+from pilmoji.helpers import Node, NodeType, to_nodes
+from pilmoji.source import BaseSource, Twemoji
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+EMOJI_CACHE_FOLDER = Path(__file__).parent.joinpath(".emoji_cache")
+HTTP_CACHE_FOLDER = Path(__file__).parent.joinpath(".web_cache")
+IMAGE_CACHE_FOLDER = Path(__file__).parent.joinpath(".image_cache")
+TWEMOJI_FOLDER = Path(__file__).parent.joinpath("assets", "twemoji")
+
+# Every emoji contains at least one of these characters
+EMOJI_CANDIDATE_REGEX = re.compile("[\u00a9\u00ae\u203c-\U0010ffff]")
+
+# Single pass baseline JPEG with 4:2:0 chroma subsampling, fastest to encode
+JPEG_SAVE_OPTIONS = {
+    "format": "JPEG",
+    "quality": 90,
+    "optimize": False,
+    "progressive": False,
+    "subsampling": 2,
+}
+# Lossless PNG with the fastest zlib level, larger files but much quicker saves
+PNG_SAVE_OPTIONS = {"format": "PNG", "compress_level": 1}
+
+
+def is_pillow_simd() -> bool:
+    """Check if Pillow-SIMD is installed, its versions end in a .postN suffix."""
+    return ".post" in PIL.__version__
+
+
+def create_session(pool_size: int = 16) -> requests.Session:
+    """
+    Create an HTTP session with keep-alive pooling and an on-disk response cache.
+
+    Args:
+        pool_size: Number of pooled connections kept per host
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    adapter = CacheControlAdapter(
+        cache=FileCache(HTTP_CACHE_FOLDER),
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _create_process_session(pid: int) -> requests.Session:
+    """Create the HTTP session of the process with the given id."""
+    return create_session()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the HTTP session of the current process, creating it on first use.
+
+    Render workers forked from the main process get their own session
+    instead of sharing the pooled sockets inherited from the parent.
+
+    Returns:
+        Configured requests session
+    """
+    return _create_process_session(os.getpid())
+
+
+# Connect and read timeouts in seconds for image downloads
+HTTP_TIMEOUT = (3, 10)
+# Remote images above these limits are rejected before being decoded
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+MAX_IMAGE_PIXELS = 50_000_000
+# Least recently used scaled images are evicted beyond this total size
+MAX_IMAGE_CACHE_BYTES = 256 * 1024 * 1024
+# Scaled images kept in memory per process, keyed by path and sizing only so
+# downloaded bytes are never held on to
+MAX_FITTED_IMAGES = 64
+_fitted_images: OrderedDict[tuple, Image.Image] = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, parsing each (path, size) pair only once per process.
+
+    Args:
+        path: Path to the .ttf font file
+        size: Font size in points
+
+    Returns:
+        Cached FreeTypeFont instance
+    """
+    return ImageFont.truetype(path, size)
+
+
+@lru_cache(maxsize=4096)
+def measure_word(font: ImageFont.FreeTypeFont, word: str) -> float:
+    """
+    Measure the advance width of a single word, once per font and word.
+
+    Args:
+        font: Font used to render the word
+        word: Word (or space) to measure
+
+    Returns:
+        Width in pixels
+    """
+    return font.getlength(word)
+
+
+def parse_text(text: str) -> list[list[Node]]:
+    """
+    Split text into Pilmoji nodes, line by line.
+
+    Plain text is returned as a single text node per line, without running
+    Pilmoji's emoji pattern (an alternation of every known emoji) over it.
+
+    Args:
+        text: Text to parse, may contain emoji and newlines
+
+    Returns:
+        List of nodes for each line of the text
+    """
+    if EMOJI_CANDIDATE_REGEX.search(text) is None:
+        return [
+            [Node(NodeType.text, line)] if line else [] for line in text.splitlines()
+        ]
+    return to_nodes(text)
+
+
+def measure_text(text: str, font: ImageFont.FreeTypeFont) -> int:
+    """
+    Measure the width of text as laid out by render_text_tile.
+
+    Emoji count as one font size wide, as Pilmoji draws them, instead of
+    the width of the missing glyph a text font would report.
+
+    Args:
+        text: Text to measure, may contain emoji and newlines
+        font: Font used to render the text
+
+    Returns:
+        Width in pixels of the widest line
+    """
+    return max(
+        (
+            sum(
+                int(font.getlength(node.content))
+                if node.type is NodeType.text
+                else font.size
+                for node in line
+            )
+            for line in parse_text(text)
+        ),
+        default=0,
+    )
+
+
+@lru_cache(maxsize=None)
+def render_blank_card(
+    size: tuple[int, int], color: tuple[int, int, int]
+) -> Image.Image:
+    """
+    Create a plain card background once, to be copied for every card.
+
+    Args:
+        size: Card size in pixels
+        color: Background color
+
+    Returns:
+        RGB template image, callers must copy it before drawing
+    """
+    return Image.new("RGB", size, color)
+
+
+@lru_cache(maxsize=None)
+def render_polygon_tile(
+    size: tuple[int, int],
+    points: tuple[tuple[float, float], ...],
+    fill: tuple[int, int, int] | str,
+) -> Image.Image:
+    """
+    Rasterize a filled polygon once onto a transparent tile for repeated pasting.
+
+    Args:
+        size: Tile size in pixels
+        points: Polygon vertices relative to the tile origin
+        fill: Polygon color
+
+    Returns:
+        RGBA tile usable as its own paste mask
+    """
+    tile = Image.new("RGBA", size, (0, 0, 0, 0))
+    ImageDraw.Draw(tile).polygon(points, fill=fill)
+    return tile
+
+
+@lru_cache(maxsize=None)
+def render_line_tile(
+    size: tuple[int, int],
+    points: tuple[tuple[float, float], ...],
+    fill: tuple[int, int, int] | str,
+    width: int,
+) -> Image.Image:
+    """
+    Rasterize a line once onto a transparent tile for repeated pasting.
+
+    Args:
+        size: Tile size in pixels
+        points: Line points relative to the tile origin
+        fill: Line color
+        width: Line width in pixels
+
+    Returns:
+        RGBA tile usable as its own paste mask
+    """
+    tile = Image.new("RGBA", size, (0, 0, 0, 0))
+    ImageDraw.Draw(tile).line(points, fill=fill, width=width)
+    return tile
+
+
+@lru_cache(maxsize=None)
+def render_gradient_tile(
+    size: tuple[int, int],
+    top_color: tuple[int, int, int],
+    bottom_color: tuple[int, int, int],
+) -> Image.Image:
+    """
+    Render a vertical gradient once for repeated pasting.
+
+    Each row color is computed on a one pixel wide column, which is then
+    stretched to the full width instead of drawing every row as a line.
+
+    Args:
+        size: Width and height of the gradient
+        top_color: RGB color of the first row
+        bottom_color: RGB color the gradient blends towards
+
+    Returns:
+        RGB tile with the gradient
+    """
+    height = size[1]
+    colors = []
+    for y in range(height):
+        # Interpolate between colors
+        ratio = y / height
+        colors.append(
+            tuple(
+                int(top * (1 - ratio) + bottom * ratio)
+                for top, bottom in zip(top_color, bottom_color)
+            )
+        )
+
+    column = Image.new("RGB", (1, height))
+    column.putdata(colors)
+    return column.resize(size, Image.Resampling.NEAREST)
+
+
+@lru_cache(maxsize=None)
+def get_emoji_sprite(
+    emoji_source: type[BaseSource], emoji: str, size: int
+) -> Image.Image | None:
+    """
+    Decode and scale an emoji image once for a given font size.
+
+    Args:
+        emoji_source: Pilmoji source class used to fetch emoji images
+        emoji: Emoji character(s) to render
+        size: Width of the sprite, the font size of the surrounding text
+
+    Returns:
+        RGBA sprite usable as its own paste mask or None if unavailable
+    """
+    stream = emoji_source().get_emoji(emoji)
+    if stream is None:
+        return None
+
+    with Image.open(stream).convert("RGBA") as asset:
+        height = math.ceil(asset.height / asset.width * size)
+        return asset.resize((size, height), Image.Resampling.LANCZOS)
+
+
+@lru_cache(maxsize=128)
+def render_text_tile(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    fill: tuple[int, int, int] | str,
+    emoji_source: type[BaseSource],
+    offset: tuple[float, float] = (0, 0),
+) -> tuple[Image.Image, int]:
+    """
+    Render text with emoji once onto a transparent tile for repeated pasting.
+
+    Only meant for short strings repeated across cards, every cached tile
+    keeps a full RGBA copy of the text in memory.
+
+    Lays text out the same way as Pilmoji.text, but composites emoji onto the
+    tile so their soft edges keep the right alpha once the tile is pasted.
+
+    Args:
+        text: Text to render, may contain emoji and newlines
+        font: Font to render the text with
+        fill: Text color
+        emoji_source: Pilmoji source class used to fetch emoji images
+        offset: Sub-pixel part of the final text position
+
+    Returns:
+        Tuple of the RGBA tile and the padding between tile origin and text origin
+    """
+    spacing = 4
+    padding = font.size
+    lines = parse_text(text)
+
+    text_width = measure_text(text, font)
+    text_height = len(lines) * (font.size + spacing)
+    tile = Image.new(
+        "RGBA", (text_width + 2 * padding, text_height + 2 * padding), (0, 0, 0, 0)
+    )
+    draw = ImageDraw.Draw(tile)
+
+    y = padding + offset[1]
+    for line in lines:
+        x = padding + offset[0]
+        for node in line:
+            width = int(font.getlength(node.content))
+            sprite = (
+                get_emoji_sprite(emoji_source, node.content, font.size)
+                if node.type is NodeType.emoji
+                else None
+            )
+            if sprite is None:
+                draw.text((x, y), node.content, fill=fill, font=font)
+            else:
+                width = font.size
+                tile.alpha_composite(sprite, (int(x), int(y)))
+            x += width
+        y += font.size + spacing
+
+    return tile, padding
+
+
+class DiskCachedTwemoji(Twemoji):
+    """Twemoji source that persists fetched emoji PNGs on disk across runs."""
+
+    def get_emoji(self, emoji: str, /) -> BytesIO | None:
+        """
+        Return the emoji image, fetching it over HTTP only on a cache miss.
+
+        Args:
+            emoji: Emoji character(s) to render
+
+        Returns:
+            BytesIO stream with the PNG data or None if unavailable
+        """
+        codepoints = "-".join(f"{ord(char):x}" for char in emoji)
+        cache_path = EMOJI_CACHE_FOLDER.joinpath(f"{codepoints}.png")
+        try:
+            return BytesIO(cache_path.read_bytes())
+        except FileNotFoundError:
+            pass
+
+        stream = super().get_emoji(emoji)
+        # Failed requests come back as an empty stream, never cache those or
+        # anything else that is not a readable image
+        content = stream.getvalue() if stream is not None else b""
+        try:
+            Image.open(BytesIO(content)).verify()
+        except (OSError, SyntaxError, ValueError):
+            logger.warning(f"Could not fetch emoji {emoji!r}")
+            return None
+
+        # Write under a temporary name, render workers may fetch the same emoji
+        try:
+            EMOJI_CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache emoji {emoji!r}: {e}")
+        return BytesIO(content)
+
+
+class LocalTwemoji(BaseSource):
+    """Twemoji source reading emoji PNGs from a local copy of the Twemoji assets."""
+
+    def get_emoji(self, emoji: str, /) -> BytesIO | None:
+        """
+        Return the emoji image from TWEMOJI_FOLDER without any network access.
+
+        Args:
+            emoji: Emoji character(s) to render
+
+        Returns:
+            BytesIO stream with the PNG data or None if unavailable
+        """
+        codepoints = [f"{ord(char):x}" for char in emoji]
+        # Twemoji file names usually drop the emoji variation selector
+        for name in (
+            "-".join(codepoints),
+            "-".join(codepoint for codepoint in codepoints if codepoint != "fe0f"),
+        ):
+            asset_path = TWEMOJI_FOLDER.joinpath(f"{name}.png")
+            if asset_path.exists():
+                return BytesIO(asset_path.read_bytes())
+        return None
+
+    def get_discord_emoji(self, id: int, /) -> BytesIO | None:
+        """Discord emoji are not part of the Twemoji assets."""
+        return None
+
+
+def download_image(url: str) -> bytes:
+    """
+    Download a remote image, refusing bodies larger than MAX_IMAGE_BYTES.
+
+    Args:
+        url: Image URL
+
+    Returns:
+        Raw image bytes
+
+    Raises:
+        requests.RequestException: If the request fails
+        ValueError: If the image is larger than MAX_IMAGE_BYTES
+    """
+    with get_session().get(url, timeout=HTTP_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        content = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            content += chunk
+            if len(content) > MAX_IMAGE_BYTES:
+                raise ValueError(f"Image larger than {MAX_IMAGE_BYTES} bytes: {url}")
+    return bytes(content)
+
+
+def _fetch_image(url: str) -> bytes | None:
+    """Download a single remote image, returning None on network errors."""
+    try:
+        return download_image(url)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(f"Could not prefetch image {url}: {e}")
+        return None
+
+
+def prefetch_images(urls: Iterable[str], max_workers: int = 16) -> dict[str, bytes]:
+    """
+    Download remote event images concurrently before rendering.
+
+    Args:
+        urls: Image URLs or local paths; local paths are ignored
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Dictionary mapping each successfully fetched URL to its raw bytes
+    """
+    remote_urls = list({url for url in urls if url.startswith("http")})
+    if not remote_urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        contents = executor.map(_fetch_image, remote_urls)
+        return {
+            url: content
+            for url, content in zip(remote_urls, contents)
+            if content is not None
+        }
+
+
+def get_image_cache_path(
+    image_url: str,
+    max_width: int,
+    resize_ratio: float | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    max_height: int | None = None,
+) -> Path:
+    """
+    Get the disk cache file of a remote image scaled by load_fitted_image.
+
+    Args:
+        image_url: Image URL
+        max_width: Maximum width of the image
+        resize_ratio: Fixed scale factor, applied even if the image already fits
+        resample: Resampling filter used to scale the image down
+        max_height: Maximum height of the scaled image, taller images are cropped
+
+    Returns:
+        Path of the cached PNG, which may not exist yet
+    """
+    key = f"{image_url}|{max_width}|{resize_ratio}|{resample}|{max_height}"
+    return IMAGE_CACHE_FOLDER.joinpath(f"{hashlib.sha1(key.encode()).hexdigest()}.png")
+
+
+def _read_cached_image(cache_path: Path) -> Image.Image | None:
+    """Load a scaled image from the disk cache, None if missing or unreadable."""
+    try:
+        img = Image.open(cache_path)
+        img.load()
+        # Mark the entry as recently used, eviction drops the oldest first
+        os.utime(cache_path)
+    except FileNotFoundError:
+        return None
+    except (OSError, SyntaxError, ValueError) as e:
+        logger.warning(f"Could not read cached image {cache_path.name}: {e}")
+        return None
+    return img
+
+
+def _write_cached_image(cache_path: Path, img: Image.Image) -> None:
+    """Store a scaled image in the disk cache, failures only log a warning."""
+    # Write under a temporary name, render workers may share the same image
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        IMAGE_CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
+        img.save(tmp_path, "PNG", compress_level=1)
+        tmp_path.replace(cache_path)
+        prune_image_cache()
+    except OSError as e:
+        logger.warning(f"Could not cache image {cache_path.name}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def prune_image_cache(max_bytes: int = MAX_IMAGE_CACHE_BYTES) -> None:
+    """
+    Delete the least recently used scaled images beyond a total size.
+
+    Args:
+        max_bytes: Maximum total size of the cached images
+    """
+    entries = []
+    for path in IMAGE_CACHE_FOLDER.glob("*.png"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            # Already evicted by another render worker
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total_bytes -= size
+
+
+def load_fitted_image(
+    image_path: str,
+    max_width: int,
+    resize_ratio: float | None = None,
+    image_data: bytes | None = None,
+    resample: Image.Resampling = Image.Resampling.LANCZOS,
+    max_height: int | None = None,
+) -> Image.Image:
+    """
+    Load an image, scale it down to fit the given width and crop its bottom.
+
+    Events sharing the same image reuse the decoded result, callers must not
+    modify the returned image in place. Scaled remote images are also kept in
+    IMAGE_CACHE_FOLDER, keyed by their URL and size, so later runs skip both
+    the download and the decoding.
+
+    Args:
+        image_path: Image URL or local file path
+        max_width: Maximum width of the image
+        resize_ratio: Fixed scale factor, applied even if the image already fits
+        image_data: Already downloaded image bytes, skips fetching image_path
+        resample: Resampling filter used to scale the image down
+        max_height: Maximum height of the scaled image, taller images are cropped
+
+    Returns:
+        PIL Image object scaled to fit max_width and cropped to max_height
+    """
+    key = (image_path, max_width, resize_ratio, resample, max_height)
+    img = _fitted_images.get(key)
+    if img is not None:
+        _fitted_images.move_to_end(key)
+        return img
+
+    img = _load_fitted_image(
+        image_path, max_width, resize_ratio, image_data, resample, max_height
+    )
+    _fitted_images[key] = img
+    if len(_fitted_images) > MAX_FITTED_IMAGES:
+        _fitted_images.popitem(last=False)
+    return img
+
+
+def _load_fitted_image(
+    image_path: str,
+    max_width: int,
+    resize_ratio: float | None,
+    image_data: bytes | None,
+    resample: Image.Resampling,
+    max_height: int | None,
+) -> Image.Image:
+    """Load and scale an image for load_fitted_image, without the memory cache."""
+    is_url = image_path.startswith("http")
+    is_remote = image_data is not None or is_url
+
+    cache_path = None
+    if is_url:
+        cache_path = get_image_cache_path(
+            image_path, max_width, resize_ratio, resample, max_height
+        )
+        img = _read_cached_image(cache_path)
+        if img is not None:
+            return img
+
+    if is_remote:
+        if image_data is None:
+            image_data = download_image(image_path)
+        img = Image.open(BytesIO(image_data))
+        # Only the header is read so far, reject decompression bombs before
+        # any pixel buffer is allocated
+        if img.width * img.height > MAX_IMAGE_PIXELS:
+            raise ValueError(
+                f"Image has more than {MAX_IMAGE_PIXELS} pixels: {image_path}"
+            )
+    else:
+        img = Image.open(image_path)
+
+    img_width, img_height = img.size
+
+    # Resize image if it's wider than available width
+    needs_resize = img_width > max_width or resize_ratio is not None
+    if needs_resize:
+        # Calculate resize ratio to fit within available width
+        if resize_ratio is None:
+            resize_ratio = max_width / img_width
+        new_width = int(img_width * resize_ratio)
+        new_height = int(img_height * resize_ratio)
+        # Let libjpeg decode at a reduced DCT scale (no-op for other formats),
+        # before any pixel data is loaded. Aim at twice the target size so the
+        # DCT only removes whole power of two factors and the resampling
+        # filter still does the final step, drafting right down to the target
+        # size visibly softens the result
+        img.draft("RGB" if is_remote else img.mode, (2 * new_width, 2 * new_height))
+
+    if is_remote:
+        img = img.convert("RGB")
+
+    if needs_resize:
+        # Only resample the source rows that survive the crop, the filter cost
+        # grows with the number of output pixels
+        box = (0, 0, img.width, img.height)
+        if max_height is not None and new_height > max_height:
+            box = (0, 0, img.width, img.height * max_height / new_height)
+            new_height = max_height
+        # Same bounded downscale as Image.thumbnail: box-reduce by an integer
+        # factor first and only run the filter on the much smaller image, while
+        # keeping the exact target size thumbnail would round off
+        img = img.resize((new_width, new_height), resample, box, reducing_gap=3.0)
+    elif max_height is not None and img_height > max_height:
+        img = img.crop((0, 0, img_width, max_height))
+    else:
+        img.load()
+
+    if cache_path is not None:
+        _write_cached_image(cache_path, img)
+
+    return img
+
 
 class EventCardGenerator:
     """Event card generator with customizable design settings."""
 
+    # The event image is cropped to max_crop_height, known before any card is
+    # laid out, so is_image_cached can find its cache entry up front
+    FIXED_IMAGE_HEIGHT = True
+
+    # Banner color for each day name, in Spanish, French and English
+    DAY_COLORS = {
+        day: color
+        for days, color in (
+            # Monday/Lunes/Lundi - Orange
+            (("LUNES", "LUNDI", "MONDAY"), (255, 152, 0)),
+            # Tuesday/Martes/Mardi - Blue
+            (("MARTES", "MARDI", "TUESDAY"), (33, 150, 243)),
+            # Wednesday/Miércoles/Mercredi - Yellow
+            (("MIERCOLES", "MIÉRCOLES", "MERCREDI", "WEDNESDAY"), (204, 153, 0)),
+            # Thursday/Jueves/Jeudi - Purple
+            (("JUEVES", "JEUDI", "THURSDAY"), (156, 39, 176)),
+            # Friday/Viernes/Vendredi - Red
+            (("VIERNES", "VENDREDI", "FRIDAY"), (244, 67, 54)),
+            # Saturday/Sábado/Samedi - Green
+            (("SABADO", "SÁBADO", "SAMEDI", "SATURDAY"), (76, 175, 80)),
+            # Sunday/Domingo/Dimanche - Teal
+            (("DOMINGO", "DIMANCHE", "SUNDAY"), (0, 150, 136)),
+        )
+        for day in days
+    }
+
     def __init__(self, width: int = 1080, height: int = 1350):
         """
         Initialize the event card generator.
@@ -39,6 +739,8 @@ class EventCardGenerator:
         # Image constants
         self.max_crop_height = 675
         self.image_resize_ratio = 1.0  # No resize by default
+        # Use BICUBIC or BILINEAR for faster, slightly softer downscales
+        self.resampling_filter = Image.Resampling.LANCZOS
 
         # Font settings
         self.font_bold = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
@@ -60,6 +762,87 @@ class EventCardGenerator:
         # Data keys
         self._description_key = "description_short"
 
+        # Emoji rendering, offline when the Twemoji assets are available
+        self.emoji_source = (
+            LocalTwemoji if TWEMOJI_FOLDER.exists() else DiskCachedTwemoji
+        )
+
+    def preload_fonts(self) -> None:
+        """
+        Load every font used by the card into the font cache.
+        """
+        for path, size in (
+            (self.font_bold, self.banner_font_size),
+            (self.font_regular, self.type_font_size),
+            (self.font_bold, self.title_font_size),
+            (self.font_regular, self.desc_font_size),
+            (self.font_bold, self.cost_font_size),
+            (self.font_regular, self.location_font_size),
+        ):
+            get_font(path, size)
+
+    def create_base_card(self) -> Image.Image:
+        """
+        Create an empty card filled with the background color.
+
+        Returns:
+            New RGB card image, copied from a cached template
+        """
+        return render_blank_card(
+            (self.card_width, self.card_height), self.background_color
+        ).copy()
+
+    def get_fitted_image(
+        self,
+        image_path: str | Path,
+        *,
+        resize: bool = False,
+        image_data: bytes | None = None,
+    ) -> Image.Image:
+        """
+        Get an image scaled and cropped to fit the card, as it gets pasted.
+
+        The result is shared through the load_fitted_image cache, callers must
+        not modify it in place.
+
+        Args:
+            image_path: Image URL or local file path
+            resize: Scale the image by image_resize_ratio instead of fitting it
+            image_data: Already downloaded image bytes, skips fetching image_path
+
+        Returns:
+            PIL Image object ready to be pasted on the card
+        """
+        return load_fitted_image(
+            str(image_path),
+            self.card_width - (2 * self.margin),
+            self.image_resize_ratio if resize else None,
+            image_data,
+            self.resampling_filter,
+            self.max_crop_height,
+        )
+
+    def is_image_cached(self, image_url: str) -> bool:
+        """
+        Check if a remote event image is already scaled in the disk cache.
+
+        Only meaningful for generators with FIXED_IMAGE_HEIGHT, the others
+        crop the image to a height that depends on each card's content.
+
+        Args:
+            image_url: Image URL
+
+        Returns:
+            True if the image can be loaded without downloading it
+        """
+        return get_image_cache_path(
+            image_url,
+            self.card_width - (2 * self.margin),
+            None,
+            self.resampling_filter,
+            self.max_crop_height,
+        ).exists()
+
     def load_and_process_image(
         self,
         card: Image.Image,
@@ -68,42 +851,19 @@ class EventCardGenerator:
         *,
         content_start_x: int | None = None,
         resize: bool = False,
+        image_data: bytes | None = None,
     ) -> int:
         """
         Load image from URL or file path and process it to fit the card with proper margins.
 
         Args:
             event: Dictionary containing event data with 'image' key
+            image_data: Already downloaded image bytes, skips fetching image_path
 
         Returns:
             PIL Image object processed and ready for card
         """
-        image_path = str(image_path)
-        if image_path.startswith("http"):
-            response = requests.get(image_path)
-            img = Image.open(BytesIO(response.content)).convert("RGB")
-        else:
-            img = Image.open(image_path)
-
-        img_width, img_height = img.size
-
-        # Calculate available width (card width minus margins)
-        available_width = self.card_width - (2 * self.margin)
-
-        # Resize image if it's wider than available width
-        if img_width > available_width or resize:
-            # Calculate resize ratio to fit within available width
-            resize_ratio = available_width / img_width
-            if resize:
-                resize_ratio = self.image_resize_ratio
-            new_width = int(img_width * resize_ratio)
-            new_height = int(img_height * resize_ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            img_width, img_height = new_width, new_height
-
-        # Crop height if image is too tall
-        if img_height > self.max_crop_height:
-            img = img.crop((0, 0, img_width, self.max_crop_height))
+        img = self.get_fitted_image(image_path, resize=resize, image_data=image_data)
 
         img_x = (self.card_width - img.width) // 2
         if content_start_x is not None:
@@ -127,43 +887,28 @@ class EventCardGenerator:
             RGB color tuple for the banner
         """
         day = date.upper()
+        # Substring match, so plurals ("Tous les jeudis") and day names glued
+        # to other characters still count, earlier weekdays take precedence
+        for name, color in self.DAY_COLORS.items():
+            if name in day:
+                return color
 
-        # Monday/Lunes/Lundi - Orange
-        if any(d in day for d in ["LUNES", "LUNDI", "MONDAY"]):
-            return (255, 152, 0)  # Orange
-        # Tuesday/Martes/Mardi - Blue
-        elif any(d in day for d in ["MARTES", "MARDI", "TUESDAY"]):
-            return (33, 150, 243)  # Blue
-        # Wednesday/Miércoles/Mercredi - Yellow
-        elif any(d in day for d in ["MIERCOLES", "MERCREDI", "WEDNESDAY"]):
-            return (204, 153, 0)  # Yellow
-        # Thursday/Jueves/Jeudi - Purple
-        elif any(d in day for d in ["JUEVES", "JEUDI", "THURSDAY"]):
-            return (156, 39, 176)  # Purple
-        # Friday/Viernes/Vendredi - Red
-        elif any(d in day for d in ["VIERNES", "VENDREDI", "FRIDAY"]):
-            return (244, 67, 54)  # Red
-        # Saturday/Sábado/Samedi - Green
-        elif any(d in day for d in ["SABADO", "SAMEDI", "SATURDAY"]):
-            return (76, 175, 80)  # Green
-        # Sunday/Domingo/Dimanche - Teal
-        elif any(d in day for d in ["DOMINGO", "DIMANCHE", "SUNDAY"]):
-            return (0, 150, 136)  # Teal
         # Default - Orange
-        else:
-            return (255, 152, 0)  # Orange
+        return (255, 152, 0)
 
     def draw_banner(
         self,
-        draw: ImageDraw.Draw,
+        card: Image.Image,
         banner_start_y: int,
         banner_color: tuple[int, int, int],
     ) -> int:
         """
         Draw an inclined banner rectangle on the card with adjustable width.
 
+        The polygon is rasterized once per geometry and color, then pasted.
+
         Args:
-            draw: ImageDraw object for drawing on the card
+            card: PIL Image object representing the card
             banner_start_y: Y position where banner starts
             banner_color: RGB color tuple for the banner
             banner_width_ratio: Ratio of card width to use for banner (0.0 to 1.0)
@@ -176,27 +921,26 @@ class EventCardGenerator:
         banner_width = available_width * self.banner_width_ratio
         banner_right_margin = self.margin + (available_width - banner_width)
 
-        # Draw inclined rectangle as polygon with adjustable width
-        banner_points = [
-            (
-                self.margin,
-                banner_start_y + self.banner_angle_offset,
-            ),  # top-left (lower)
-            (
-                self.card_width - banner_right_margin,
-                banner_start_y,
-            ),  # top-right (higher)
+        # Inclined rectangle as polygon with adjustable width, relative to banner_start_y
+        banner_points = (
+            (self.margin, self.banner_angle_offset),  # top-left (lower)
+            (self.card_width - banner_right_margin, 0),  # top-right (higher)
             (
                 self.card_width - banner_right_margin,
-                banner_start_y + self.banner_height,
+                self.banner_height,
             ),  # bottom-right
             (
                 self.margin,
-                banner_start_y + self.banner_height + self.banner_angle_offset,
+                self.banner_height + self.banner_angle_offset,
             ),  # bottom-left (lower)
-        ]
+        )
+        tile_size = (
+            self.card_width,
+            self.banner_height + self.banner_angle_offset + 1,
+        )
 
-        draw.polygon(banner_points, fill=banner_color)
+        banner_tile = render_polygon_tile(tile_size, banner_points, banner_color)
+        card.paste(banner_tile, (0, banner_start_y), banner_tile)
         return banner_start_y + self.banner_height + self.banner_angle_offset + 30
 
     def add_banner_text(
@@ -214,8 +958,6 @@ class EventCardGenerator:
             date: Date string to display on banner
             banner_start_y: Y position where banner starts
         """
-        draw = ImageDraw.Draw(card)
-
         # Calculate banner dimensions
         available_width = self.card_width - (2 * self.margin)
         banner_width = available_width * self.banner_width_ratio
@@ -223,37 +965,34 @@ class EventCardGenerator:
         banner_left = self.margin
         banner_right = self.card_width - banner_right_margin
 
-        with Pilmoji(card) as pilmoji:
-            bbox = draw.textbbox((0, 0), date, font=font_type)
-            text_width = bbox[2] - bbox[0]
+        text_width = measure_text(date, font_type)
 
-            # Calculate text position based on banner width and position ratio
-            # 0.0 = left aligned within banner, 0.5 = center, 1.0 = right aligned
-            banner_text_area = banner_right - banner_left
-            available_text_space = banner_text_area - text_width
-            text_x = banner_left + (
-                available_text_space * self.banner_text_position_ratio
-            )
+        # Calculate text position based on banner width and position ratio
+        # 0.0 = left aligned within banner, 0.5 = center, 1.0 = right aligned
+        banner_text_area = banner_right - banner_left
+        available_text_space = banner_text_area - text_width
+        text_x = banner_left + (available_text_space * self.banner_text_position_ratio)
 
-            text_y = (
-                banner_start_y
-                + (self.banner_height - self.banner_font_size) // 2
-                + self.banner_angle_offset // 2
-            )
+        text_y = (
+            banner_start_y
+            + (self.banner_height - self.banner_font_size) // 2
+            + self.banner_angle_offset // 2
+        )
 
-            pilmoji.text(
-                (text_x, text_y),
-                date,
-                font=font_type,
-                fill=self.banner_text_color,
-            )
+        self.paste_text(
+            card,
+            (text_x, text_y),
+            date,
+            font_type,
+            self.banner_text_color,
+        )
 
+    @staticmethod
     def _wrap_paragraph(
-        self,
         paragraph: str,
         font: ImageFont.FreeTypeFont,
         max_width: int,
-        draw: ImageDraw.Draw,
+        max_lines: int | None = None,
     ) -> list[str]:
         """
         Wrap a single paragraph to fit within specified width.
@@ -262,36 +1001,59 @@ class EventCardGenerator:
             paragraph: Single paragraph text to wrap
             font: Font to use for text measurement
             max_width: Maximum width in pixels
-            draw: ImageDraw object for text measurement
+            max_lines: Stop wrapping once this many lines are produced
 
         Returns:
             List of wrapped lines for the paragraph
         """
-        lines = []
         words = paragraph.split()
-        current_line = ""
+        # Short paragraphs fit on a single line, skip the word by word search
+        if words and font.getlength(paragraph) <= max_width:
+            return [" ".join(words)]
 
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            if bbox[2] - bbox[0] <= max_width:
-                current_line = test_line
+        lines = []
+        space_width = measure_word(font, " ")
+        # offsets[i] is the width of words[:i], each followed by a space, from
+        # cached word widths so each word is only laid out once
+        offsets = list(
+            accumulate(
+                (measure_word(font, word) + space_width for word in words), initial=0
+            )
+        )
+
+        start = 0
+        while start < len(words) and (max_lines is None or len(lines) < max_lines):
+            # Seed the line with the last word ending within max_width
+            end = max(
+                start + 1,
+                bisect_right(offsets, offsets[start] + max_width + space_width) - 1,
+            )
+
+            # Check the seed with one real measurement, which accounts for kerning:
+            # expand while the next word still fits, otherwise shrink until it fits
+            if font.getlength(" ".join(words[start:end])) <= max_width:
+                while (
+                    end < len(words)
+                    and font.getlength(" ".join(words[start : end + 1])) <= max_width
+                ):
+                    end += 1
             else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+                while end - start > 1:
+                    end -= 1
+                    if font.getlength(" ".join(words[start:end])) <= max_width:
+                        break
 
-        if current_line:
-            lines.append(current_line)
+            lines.append(" ".join(words[start:end]))
+            start = end
 
         return lines
 
+    @staticmethod
     def _wrap_text_with_newlines(
-        self,
         text: str,
         font: ImageFont.FreeTypeFont,
         max_width: int,
-        draw: ImageDraw.Draw,
+        max_lines: int | None = None,
     ) -> list[str]:
         """
         Wrap text that contains explicit newlines.
@@ -300,7 +1062,7 @@ class EventCardGenerator:
             text: Text containing newlines to wrap
             font: Font to use for text measurement
             max_width: Maximum width in pixels
-            draw: ImageDraw object for text measurement
+            max_lines: Stop wrapping once this many lines are produced
 
         Returns:
             List of wrapped lines preserving paragraph structure
@@ -309,11 +1071,19 @@ class EventCardGenerator:
         paragraphs = text.split("\n")
 
         for paragraph in paragraphs:
+            if max_lines is not None and len(lines) >= max_lines:
+                break
+
             if not paragraph.strip():  # Empty line
                 lines.append("")
                 continue
 
-            paragraph_lines = self._wrap_paragraph(paragraph, font, max_width, draw)
+            paragraph_lines = EventCardGenerator._wrap_paragraph(
+                paragraph,
+                font,
+                max_width,
+                None if max_lines is None else max_lines - len(lines),
+            )
             lines.extend(paragraph_lines)
 
         return lines
@@ -323,7 +1093,6 @@ class EventCardGenerator:
         text: str,
         font: ImageFont.FreeTypeFont,
         max_width: int,
-        draw: ImageDraw.Draw,
     ) -> list[str]:
         """
         Wrap text to fit within specified width, limiting to max lines.
@@ -333,22 +1102,38 @@ class EventCardGenerator:
             text: Text to wrap
             font: Font to use for text measurement
             max_width: Maximum width in pixels
-            draw: ImageDraw object for text measurement
 
         Returns:
             List of text lines that fit within the width
         """
-        # Check if text contains explicit newlines
-        if "\n" in text:
-            lines = self._wrap_text_with_newlines(text, font, max_width, draw)
-        else:
-            lines = self._wrap_paragraph(text, font, max_width, draw)
+        return list(
+            self._wrap_text_cached(text, font, max_width, self.max_description_lines)
+        )
 
-        return lines[: self.max_description_lines]
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _wrap_text_cached(
+        text: str,
+        font: ImageFont.FreeTypeFont,
+        max_width: int,
+        max_lines: int,
+    ) -> tuple[str, ...]:
+        """Wrap text once per text, font, width and line limit, for repeated events."""
+        # Check if text contains explicit newlines, stop at the line limit
+        if "\n" in text:
+            return tuple(
+                EventCardGenerator._wrap_text_with_newlines(
+                    text, font, max_width, max_lines
+                )
+            )
+        return tuple(
+            EventCardGenerator._wrap_paragraph(text, font, max_width, max_lines)
+        )
 
     def add_event_info(
         self,
         card: Image.Image,
+        draw: ImageDraw.ImageDraw,
         text: str,
         y_position: int,
         font_type: ImageFont.FreeTypeFont,
@@ -356,26 +1141,101 @@ class EventCardGenerator:
         x_position: int | None = None,
         section_spacing: int | None = None,
         split_text: bool = False,
+        cache_tile: bool = False,
     ) -> int:
-        """Add event type/category with emoji to the card."""
+        """Add event type/category with emoji to the card.
+
+        Text repeated across cards (types, costs, locations) should set
+        cache_tile to be rasterized once and pasted, anything else is drawn
+        directly.
+        """
         if split_text:
             return self.split_text(
-                card, text, y_position, font_type, x_position=x_position
+                card, draw, text, y_position, font_type, x_position=x_position
             )
 
         x_position = x_position or self.left_margin
-        with Pilmoji(card) as pilmoji:
-            pilmoji.text(
-                (x_position, y_position),
-                text,
-                font=font_type,
-                fill="black",
+        if cache_tile:
+            self.paste_text(card, (x_position, y_position), text, font_type, "black")
+        else:
+            self.draw_text(
+                card, draw, (x_position, y_position), text, font_type, "black"
             )
         return y_position + (section_spacing or self.section_spacing)
 
+    def paste_text(
+        self,
+        card: Image.Image,
+        position: tuple[float, float],
+        text: str,
+        font_type: ImageFont.FreeTypeFont,
+        fill: tuple[int, int, int] | str,
+    ):
+        """
+        Paste text onto the card from the rendered-text tile cache.
+
+        Strings repeated across cards (event types, costs, locations, day
+        names) are rasterized once and only pasted afterwards.
+
+        Args:
+            card: PIL Image object representing the card
+            position: (x, y) position of the text origin
+            text: Text to draw, may contain emoji
+            font_type: Font to render the text with
+            fill: Text color
+        """
+        x, y = position
+        tile_x, tile_y = int(x), int(y)
+        tile, padding = render_text_tile(
+            text, font_type, fill, self.emoji_source, (x - tile_x, y - tile_y)
+        )
+        card.paste(tile, (tile_x - padding, tile_y - padding), tile)
+
+    def draw_text(
+        self,
+        card: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        position: tuple[float, float],
+        text: str,
+        font_type: ImageFont.FreeTypeFont,
+        fill: tuple[int, int, int] | str,
+    ) -> None:
+        """
+        Draw text with emoji directly on the card, pasting cached emoji sprites.
+
+        Lays text out the same way as Pilmoji.text, for text that is not worth
+        caching as a whole tile.
+
+        Args:
+            card: PIL Image object representing the card
+            draw: ImageDraw handle bound to the card
+            position: Top left corner of the text
+            text: Text to draw, may contain emoji and newlines
+            font_type: Font to draw the text with
+            fill: Text color
+        """
+        spacing = 4
+        x_position, y = position
+        for line in parse_text(text):
+            x = x_position
+            for node in line:
+                sprite = (
+                    get_emoji_sprite(self.emoji_source, node.content, font_type.size)
+                    if node.type is NodeType.emoji
+                    else None
+                )
+                if sprite is None:
+                    draw.text((x, y), node.content, fill=fill, font=font_type)
+                    x += int(font_type.getlength(node.content))
+                else:
+                    card.paste(sprite, (int(x), int(y)), sprite)
+                    x += font_type.size
+            y += font_type.size + spacing
+
     def split_text(
         self,
         card: Image.Image,
+        draw: ImageDraw.ImageDraw,
         text: str,
         y_position: int,
         font_type: ImageFont.FreeTypeFont,
@@ -384,20 +1244,20 @@ class EventCardGenerator:
         section_spacing: int | None = None,
     ) -> int:
         """Add wrapped event description to the card."""
-        draw = ImageDraw.Draw(card)
         max_desc_width = self.card_width - self.left_margin - self.right_margin
 
-        lines = self.wrap_text(text, font_type, max_desc_width, draw)
+        lines = self.wrap_text(text, font_type, max_desc_width)
 
         x_position = x_position or self.left_margin
-        with Pilmoji(card) as pilmoji:
-            for i, line in enumerate(lines):
-                pilmoji.text(
-                    (x_position, y_position + i * self.line_spacing),
-                    line,
-                    font=font_type,
-                    fill="black",
-                )
+        for i, line in enumerate(lines):
+            self.draw_text(
+                card,
+                draw,
+                (x_position, y_position + i * self.line_spacing),
+                line,
+                font_type,
+                "black",
+            )
 
         return (
             y_position
@@ -407,94 +1267,184 @@ class EventCardGenerator:
 
     def add_separator_line(self, card: Image.Image, y_position: int) -> int:
         """Add a horizontal separator line to the card."""
-        draw = ImageDraw.Draw(card)
-        draw.line(
-            [
-                (self.left_margin, y_position),
-                (self.card_width - self.right_margin, y_position),
-            ],
-            fill="black",
-            width=2,
+        line_width = 2
+        separator_tile = render_line_tile(
+            (self.card_width, 2 * line_width + 1),
+            (
+                (self.left_margin, line_width),
+                (self.card_width - self.right_margin, line_width),
+            ),
+            "black",
+            line_width,
         )
+        card.paste(separator_tile, (0, y_position - line_width), separator_tile)
         return y_position + 30
 
     def add_content(
-        self, card: Image.Image, event: dict[str, str], content_start_y: int
+        self,
+        card: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        event: dict[str, str],
+        content_start_y: int,
     ) -> int:
         """Add all event content to the card."""
         y_pos = content_start_y + 20  # Small padding from banner
 
         y_pos = self.add_event_info(
             card,
+            draw,
             f"🎉 {event['type']}",
             y_pos,
-            ImageFont.truetype(self.font_regular, self.type_font_size),
+            get_font(self.font_regular, self.type_font_size),
+            cache_tile=True,
         )
         y_pos = self.add_event_info(
             card,
+            draw,
             event["title"],
             y_pos,
-            ImageFont.truetype(self.font_bold, self.title_font_size),
+            get_font(self.font_bold, self.title_font_size),
         )
         y_pos = self.add_event_info(
             card,
+            draw,
             event[self._description_key],
             y_pos,
-            ImageFont.truetype(self.font_regular, self.desc_font_size),
+            get_font(self.font_regular, self.desc_font_size),
             split_text=True,
         )
         y_pos = self.add_event_info(
             card,
+            draw,
             event["cost"],
             y_pos,
-            ImageFont.truetype(self.font_bold, self.cost_font_size),
+            get_font(self.font_bold, self.cost_font_size),
             section_spacing=50,
+            cache_tile=True,
         )
         y_pos = self.add_separator_line(card, y_pos)
         y_pos = self.add_event_info(
             card,
+            draw,
             f"📍 {event['location']}",
             y_pos,
-            ImageFont.truetype(self.font_regular, self.location_font_size),
+            get_font(self.font_regular, self.location_font_size),
             section_spacing=50,
+            cache_tile=True,
         )
 
         return y_pos
 
-    def create_event_card(self, event: dict[str, str], output_path: str):
+    def create_event_cards(
+        self,
+        events: list[dict[str, str]],
+        output_paths: list[Path],
+        images: dict[str, bytes] | None = None,
+        max_workers: int | None = None,
+    ):
+        """
+        Create several event cards in parallel worker processes.
+
+        Args:
+            events: List of event dictionaries
+            output_paths: Path where each card should be saved, in event order
+            images: Prefetched image bytes keyed by image URL, if available
+            max_workers: Maximum number of worker processes, defaults to CPU count
+        """
+        images = images or {}
+        render_event_cards(
+            [
+                (self, event, output_path, images.get(event["image"]))
+                for event, output_path in zip(events, output_paths)
+            ],
+            max_workers,
+        )
+
+    def create_event_card(
+        self,
+        event: dict[str, str],
+        output_path: str,
+        image_data: bytes | None = None,
+    ):
         """
         Create an event card with standardized design.
 
         Args:
             event: Dictionary containing event data
             output_path: Path where the generated card image should be saved
+            image_data: Prefetched bytes of the event image, if available
         """
         # Create base card
-        card = Image.new(
-            "RGB", (self.card_width, self.card_height), self.background_color
-        )
+        card = self.create_base_card()
+        # Drawing handle shared by every text helper of the card
         draw = ImageDraw.Draw(card)
-
         # Load and process event image
         banner_start_y = self.load_and_process_image(
-            card, event["image"], self.start_card
+            card, event["image"], self.start_card, image_data=image_data
         )
 
         # Draw inclined banner
         banner_color = self.get_color(event["date"])
-        content_start_y = self.draw_banner(draw, banner_start_y, banner_color)
+        content_start_y = self.draw_banner(card, banner_start_y, banner_color)
 
         # Add banner text
         self.add_banner_text(
             card,
             event["date"],
             banner_start_y,
-            ImageFont.truetype(self.font_bold, self.banner_font_size),
+            get_font(self.font_bold, self.banner_font_size),
         )
 
         # Add event content
-        self.add_content(card, event, content_start_y)
+        self.add_content(card, draw, event, content_start_y)
 
         # Save the card
-        card.save(output_path, quality=95)
+        card.save(output_path, **JPEG_SAVE_OPTIONS)
         logger.info(f"✅ Saved card at {output_path}")
+
+
+def _warmup(generators: list[EventCardGenerator]) -> None:
+    """Load the fonts once per worker process before rendering any card."""
+    for generator in generators:
+        generator.preload_fonts()
+
+
+def _render_event_card(
+    task: tuple[EventCardGenerator, dict[str, str], Path, bytes | None],
+) -> None:
+    generator, event, output_path, image_data = task
+    generator.create_event_card(event, output_path, image_data)
+
+
+def render_cards(
+    render: Callable[[tuple], None],
+    tasks: list[tuple],
+    max_workers: int | None = None,
+):
+    """
+    Render independent cards in parallel worker processes.
+
+    Args:
+        render: Picklable module-level function rendering a single task
+        tasks: Render arguments per card, starting with the card generator
+        max_workers: Maximum number of worker processes, defaults to CPU count
+    """
+    generators = list({id(task[0]): task[0] for task in tasks}.values())
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_warmup, initargs=(generators,)
+    ) as executor:
+        list(executor.map(render, tasks))
+
+
+def render_event_cards(
+    tasks: list[tuple[EventCardGenerator, dict[str, str], Path, bytes | None]],
+    max_workers: int | None = None,
+):
+    """
+    Render independent event cards in parallel worker processes.
+
+    Args:
+        tasks: Generator, event, output path and prefetched image bytes per card
+        max_workers: Maximum number of worker processes, defaults to CPU count
+    """
+    render_cards(_render_event_card, tasks, max_workers)
@@ -3,12 +3,38 @@ import logging
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `json` extra
+    orjson = None
+
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
 )
 
 logger = logging.getLogger(__name__)
 
+NOT_FOUND = "not found"
+FIELDS_TO_OVERWRITE = (
+    "title",
+    "location",
+    "description_short",
+    "description_long",
+    "cost",
+    "type",
+)
+
+
+def load_json(file_path: Path) -> Any:
+    """Load a JSON file, with orjson when available.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    data = file_path.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
 
 class EventMerger:
     """Class to handle event merging operations."""
@@ -20,43 +46,34 @@ class EventMerger:
     def load_json_file(self, file_path: Path) -> list[dict[str, Any]]:
         """Load JSON file and return the data."""
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                return json.load(f)
+            return load_json(file_path)
         except Exception as e:
-            logger.error(f"Error loading {file_path}: {e}")
+            logger.error("Error loading %s: %s", file_path, e)
             return []
 
     def create_link_map(
         self, events: list[dict[str, Any]]
-    ) -> dict[str, dict[str, Any]]:
-        """Create a mapping of links to events."""
-        return {
-            link: event
-            for event in events
-            if (link := event.get("link", "").strip()) and link != "not found"
-        }
+    ) -> tuple[dict[str, dict[str, Any]], list[str]]:
+        """Create a mapping of links to events, plus the stripped link of each event."""
+        link_map = {}
+        links = []
+        for event in events:
+            link = event.get("link", "").strip()
+            links.append(link)
+            if link and link != NOT_FOUND:
+                link_map[link] = event
+        return link_map, links
 
     def merge_single_event(
         self, non_detailed_event: dict[str, Any], detailed_event: dict[str, Any]
     ) -> dict[str, Any]:
         """Merge two events, overwriting specific fields from source to base."""
-        merged_event = non_detailed_event.copy()
-
-        fields_to_overwrite = [
-            "title",
-            "location",
-            "description_short",
-            "description_long",
-            "cost",
-            "type",
-        ]
-
-        for field in fields_to_overwrite:
-            source_value = detailed_event.get(field, "").strip()
-            if source_value and source_value != "not found":
-                merged_event[field] = source_value
-
-        return merged_event
+        overrides = {
+            field: value
+            for field in FIELDS_TO_OVERWRITE
+            if (value := detailed_event.get(field, "").strip()) and value != NOT_FOUND
+        }
+        return {**non_detailed_event, **overrides}
 
     def find_common_links(
         self,
@@ -64,8 +81,8 @@ class EventMerger:
         detailed_link_map: dict[str, dict[str, Any]],
     ) -> set[str]:
         """Find common links between two link maps."""
-        common_links = set(non_detailed_link_map) & set(detailed_link_map)
-        logger.info(f"Found {len(common_links)} common events")
+        common_links = non_detailed_link_map.keys() & detailed_link_map.keys()
+        logger.info("Found %d common events", len(common_links))
         return common_links
 
     def merge_common_events(
@@ -75,33 +92,42 @@ class EventMerger:
         common_links: set[str],
     ) -> list[dict[str, Any]]:
         """Merge all common events and return the list."""
-        common_events = []
-
-        for link in common_links:
-            non_detailed_event = non_detailed_link_map[link]
-            detailed_event = detailed_link_map[link]
-
-            merged_event = self.merge_single_event(non_detailed_event, detailed_event)
-            common_events.append(merged_event)
-
-            logger.info(
-                f"Merged event: {merged_event.get('title', 'No title')[:50]}..."
+        common_events = [
+            self.merge_single_event(
+                non_detailed_link_map[link], detailed_link_map[link]
             )
+            for link in common_links
+        ]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for merged_event in common_events:
+                logger.debug(
+                    "Merged event: %s...", merged_event.get("title", "No title")[:50]
+                )
+        logger.info("Merged %d common events", len(common_events))
 
         return common_events
 
     def filter_non_common_events(
-        self, events_non_detailed: list[dict[str, Any]], common_links: set[str]
+        self,
+        events_non_detailed: list[dict[str, Any]],
+        non_detailed_links: list[str],
+        common_links: set[str],
     ) -> list[dict[str, Any]]:
-        """Filter out common events from the original events list."""
+        """Filter out common events from the original events list.
+
+        non_detailed_links holds the stripped link of each event, as returned
+        by create_link_map.
+        """
         non_common_events = [
             event
-            for event in events_non_detailed
-            if event.get("link", "").strip() not in common_links
+            for event, link in zip(events_non_detailed, non_detailed_links)
+            if link not in common_links
         ]
 
         logger.info(
-            f"Found {len(non_common_events)} non-common events to keep in events_non_detailed file"
+            "Found %d non-common events to keep in events_non_detailed file",
+            len(non_common_events),
         )
         return non_common_events
 
@@ -117,13 +143,25 @@ class EventMerger:
     ) -> None:
         """Save events list to JSON file."""
         try:
-            with file_path.open("w", encoding="utf-8") as f:
-                json.dump(events, f, ensure_ascii=False, indent=4)
+            # orjson only supports two space indentation, the stdlib fallback
+            # matches it so saved files do not depend on orjson being installed
+            if orjson:
+                data = orjson.dumps(events, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(events, ensure_ascii=False, indent=2).encode()
+            # Write under a temporary name, a failed write must not truncate
+            # the events file being rewritten
+            tmp_path = file_path.with_suffix(f"{file_path.suffix}.tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(file_path)
             logger.info(
-                f"✅ Successfully {description} {file_path} with {len(events)} events"
+                "✅ Successfully %s %s with %d events",
+                description,
+                file_path,
+                len(events),
             )
         except Exception as e:
-            logger.error(f"❌ Error saving to {file_path}: {e}")
+            logger.error("❌ Error saving to %s: %s", file_path, e)
 
     def load_and_validate_files(
         self, events_non_detailed_file: Path, events_detailed_file: Path
@@ -135,9 +173,9 @@ class EventMerger:
         events_detailed = self.load_json_file(events_detailed_file)
 
         logger.info(
-            f"Loaded {len(events_non_detailed)} events from events_non_detailed file"
+            "Loaded %d events from events_non_detailed file", len(events_non_detailed)
         )
-        logger.info(f"Loaded {len(events_detailed)} events from events_detailed file")
+        logger.info("Loaded %d events from events_detailed file", len(events_detailed))
 
         return events_non_detailed, events_detailed
 
@@ -145,19 +183,27 @@ class EventMerger:
         self,
         events_non_detailed: list[dict[str, Any]],
         events_detailed: list[dict[str, Any]],
-    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
-        """Create link maps for both event lists."""
-        non_detailed_link_map = self.create_link_map(events_non_detailed)
-        detailed_link_map = self.create_link_map(events_detailed)
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]], list[str]]:
+        """Create link maps for both event lists.
+
+        Also returns the stripped link of every events_non_detailed entry, used
+        to filter out the common events.
+        """
+        non_detailed_link_map, non_detailed_links = self.create_link_map(
+            events_non_detailed
+        )
+        detailed_link_map, _ = self.create_link_map(events_detailed)
 
         logger.info(
-            f"Found {len(non_detailed_link_map)} events with valid links in events_non_detailed file"
+            "Found %d events with valid links in events_non_detailed file",
+            len(non_detailed_link_map),
         )
         logger.info(
-            f"Found {len(detailed_link_map)} events with valid links in events_detailed file"
+            "Found %d events with valid links in events_detailed file",
+            len(detailed_link_map),
         )
 
-        return non_detailed_link_map, detailed_link_map
+        return non_detailed_link_map, detailed_link_map, non_detailed_links
 
     def process_and_save_events(
         self,
@@ -188,8 +234,8 @@ class EventMerger:
         )
 
         # Create link maps
-        non_detailed_link_map, detailed_link_map = self.create_link_maps(
-            events_non_detailed, events_detailed
+        non_detailed_link_map, detailed_link_map, non_detailed_links = (
+            self.create_link_maps(events_non_detailed, events_detailed)
         )
 
         # Find common links
@@ -202,7 +248,7 @@ class EventMerger:
 
         # Filter non-common events
         non_common_events = self.filter_non_common_events(
-            events_non_detailed, common_links
+            events_non_detailed, non_detailed_links, common_links
         )
 
         # Process and save results
@@ -216,11 +262,11 @@ def validate_input_files(
 ) -> bool:
     """Validate that input files exist."""
     if not events_non_detailed_file.exists():
-        logger.error(f"❌ File not found: {events_non_detailed_file}")
+        logger.error("❌ File not found: %s", events_non_detailed_file)
         return False
 
     if not events_detailed_file.exists():
-        logger.error(f"❌ File not found: {events_detailed_file}")
+        logger.error("❌ File not found: %s", events_detailed_file)
         return False
 
     return True
@@ -232,10 +278,11 @@ def print_summary(
     """Print process summary."""
     logger.info("\n📊 Summary:")
     logger.info(
-        f"Base file: {events_non_detailed_file} (updated to contain only non-common events)"
+        "Base file: %s (updated to contain only non-common events)",
+        events_non_detailed_file,
     )
-    logger.info(f"Source file: {events_detailed_file}")
-    logger.info(f"Output file: {output_file} (contains merged common events)")
+    logger.info("Source file: %s", events_detailed_file)
+    logger.info("Output file: %s (contains merged common events)", output_file)
     logger.info(
         "\nFields overwritten from source: title, location, description_short, description_long, cost, type"
     )
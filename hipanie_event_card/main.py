@@ -1,14 +1,21 @@
-import json
 import logging
 import argparse
 from pathlib import Path
 from story_event_card_generator import StoryEventCardGenerator
-from event_card_generator import EventCardGenerator
+from event_card_generator import (
+    EventCardGenerator,
+    is_pillow_simd,
+    prefetch_images,
+    render_event_cards,
+)
 from hipanie_event_card.story_motivation_card_generator import (
     StoryMotivationCardGenerator,
 )
-from hipanie_event_card.motivation_card_generator import MotivationCardGenerator
-from find_common_events import EventMerger
+from hipanie_event_card.motivation_card_generator import (
+    MotivationCardGenerator,
+    render_motivation_cards,
+)
+from find_common_events import EventMerger, load_json
 from datetime import datetime, timedelta
 from weather_service import WeatherService
 from typing import Any
@@ -44,6 +51,8 @@ FR_MONTHS = {
     "December": "Décembre",
 }
 
+FR_MONTHS_UPPER = {month: name.upper() for month, name in FR_MONTHS.items()}
+
 FR_MONTHS_SHORT = {
     "January": "Janv.",
     "February": "Févr.",
@@ -79,6 +88,11 @@ ES_DAYS = {
     "Sunday": "Domingo",
 }
 
+# English names keying the maps above, indexed by weekday() and month - 1,
+# so lookups don't depend on the locale used by strftime
+WEEKDAYS = tuple(FR_DAYS)
+MONTHS = tuple(FR_MONTHS)
+
 # Weekly motivation messages mapping based on the images
 WEEKLY_MESSAGES = {
     "Monday": {
@@ -118,6 +132,16 @@ WEEKLY_MESSAGES = {
     },
 }
 
+# Day names and messages of each day motivation card, indexed by weekday()
+DAY_CARD_TEXTS = tuple(
+    {
+        "day_name_es": ES_DAYS[day_name],
+        "day_name_fr": FR_DAYS[day_name],
+        **WEEKLY_MESSAGES[day_name],
+    }
+    for day_name in WEEKDAYS
+)
+
 # Add your OpenWeatherMap API key here
 WEATHER_API_KEY = (
     "your_openweathermap_api_key_here"  # Get from https://openweathermap.org/api
@@ -237,6 +261,9 @@ def main():
     elif not args.all:
         logger.info("Running all sections (use --sections to run specific ones)")
 
+    if not is_pillow_simd():
+        logger.info("Pillow-SIMD is not installed, see the README for faster rendering")
+
     weather_service = (
         WeatherService(WEATHER_API_KEY)
         if WEATHER_API_KEY != "your_openweathermap_api_key_here"
@@ -257,10 +284,8 @@ def main():
         data_cards = [
             {
                 "datetime": single_date,
-                "date": f"{single_date.day} {FR_MONTHS[single_date.strftime('%B')].upper()}",
-                "day_name_es": ES_DAYS[single_date.strftime("%A")],
-                "day_name_fr": FR_DAYS[single_date.strftime("%A")],
-                **WEEKLY_MESSAGES[single_date.strftime("%A")],
+                "date": f"{single_date.day} {FR_MONTHS_UPPER[MONTHS[single_date.month - 1]]}",
+                **DAY_CARD_TEXTS[single_date.weekday()],
             }
             for single_date in (next_monday + timedelta(n) for n in range(7))
         ]
@@ -271,45 +296,104 @@ def main():
         generate_week_motivation_cards(["nantes"], CALCULATION_DATE, weather_service)
 
 
-def generate_event_cards(cities: list[str]):
+def generate_event_cards(cities: list[str], max_workers: int | None = None):
     logger.info("Starting event card generation...")
     image_sizes = [(1080, 1350), (1080, 1920)]
+    generators = []
+    for width, height in image_sizes:
+        if height >= 1900:  # Story format
+            generators.append((StoryEventCardGenerator(width, height), "story"))
+        else:  # Standard format
+            generators.append((EventCardGenerator(width, height), "standard"))
+
+    tasks = []
     for city in cities:
         event_file_path = INPUT_FOLDER.joinpath(f"events_{city}.json")
         if not event_file_path.exists():
             logger.warning(f"Event file does not exist: {event_file_path}")
             continue
 
-        with event_file_path.open("r", encoding="utf-8") as f:
-            events = json.load(f)
+        events = load_json(event_file_path)
 
-        for width, height in image_sizes:
-            if height >= 1900:  # Story format
-                generator = StoryEventCardGenerator(width, height)
-                prefix = "story"
-            else:  # Standard format
-                generator = EventCardGenerator(width, height)
-                prefix = "standard"
+        # Download all event images concurrently, shared by every card size,
+        # except those already scaled on disk for every size. Story cards only
+        # know their image height once laid out, they download it themselves
+        # if missing from the cache
+        checked_generators = [
+            generator for generator, _ in generators if generator.FIXED_IMAGE_HEIGHT
+        ]
+        images = prefetch_images(
+            event["image"]
+            for event in events
+            if not checked_generators
+            or not all(
+                generator.is_image_cached(event["image"])
+                for generator in checked_generators
+            )
+        )
 
+        for generator, prefix in generators:
+            width, height = generator.card_width, generator.card_height
+            # Only the event index changes between the cards of a size
+            file_name = f"{prefix}_event_card_{city}_{{}}_{width}x{height}.jpg"
             for i, event in enumerate(events):
-                generator.create_event_card(
-                    event,
-                    IMAGE_FOLDER.joinpath(
-                        f"{prefix}_event_card_{city}_{i}_{width}x{height}.jpg"
-                    ),
+                tasks.append(
+                    (
+                        generator,
+                        event,
+                        IMAGE_FOLDER.joinpath(file_name.format(i)),
+                        images.get(event["image"]),
+                    )
                 )
 
+    # Every card is independent, render them on all cores
+    render_event_cards(tasks, max_workers)
+
     logger.info("Event card generation completed!")
 
 
 def generate_day_motivation_cards(
     cities: list[str],
-    data_cards: dict[str, Any],
+    data_cards: list[dict[str, Any]],
     weather_service: WeatherService | None = None,
+    max_workers: int | None = None,
 ):
     logger.info("Starting weekly story motivation card generation for big cities...")
     image_sizes = [(1080, 1920), (1080, 1350)]
+
+    # Fetch the weather of every city and date concurrently
+    weather = {}
+    if weather_service:
+        weather = weather_service.get_weather_for_cities(
+            (CITY_MAPPING[city], card_data["datetime"])
+            for city in cities
+            for card_data in data_cards
+        )
+
+    tasks = []
     for city in cities:
+        # Copy the cards for each city, the shared data_cards are never modified
+        city_cards = [dict(card_data) for card_data in data_cards]
+
+        # Add weather data for each city and date, shared by every card size
+        if weather_service:
+            for card_data in city_cards:
+                card_data["weather"] = weather[
+                    (CITY_MAPPING[city], card_data["datetime"])
+                ]
+
+        # Standard cards ask what to do in the city on that day
+        standard_cards = [
+            {
+                **card_data,
+                "spanish_text": f"¿Qué hacer en {city.capitalize()} este {card_data['day_name_es']}?",
+                "french_text": f"Quoi faire à {city.capitalize()} ce {card_data['day_name_fr']} ?",
+                "emoji": "💃",
+                "date": f"{FR_MONTHS_SHORT[MONTHS[card_data['datetime'].month - 1]]}\n  {card_data['datetime'].day} ",
+            }
+            for card_data in city_cards
+        ]
+
         for width, height in image_sizes:
             if height >= 1900:  # Story format
                 generator = StoryMotivationCardGenerator(width, height)
@@ -318,33 +402,23 @@ def generate_day_motivation_cards(
                 generator = MotivationCardGenerator(width, height)
                 prefix = "standard"
 
-            for card_data in data_cards:
-                # Add weather data for each city and date
-                if weather_service:
-                    weather_data = weather_service.get_weather_for_city(
-                        CITY_MAPPING[city], card_data["datetime"]
-                    )
-                    card_data["weather"] = weather_data
-
-                if height == 1350:
-                    single_date = card_data["datetime"]
-                    card_data["spanish_text"] = (
-                        f"¿Qué hacer en {city.capitalize()} este {card_data['day_name_es']}?"
-                    )
-                    card_data["french_text"] = (
-                        f"Quoi faire à {city.capitalize()} ce {card_data['day_name_fr']} ?"
-                    )
-                    card_data["emoji"] = "💃"
-                    card_data["date"] = (
-                        f"{FR_MONTHS_SHORT[single_date.strftime('%B')]}\n  {single_date.day} "
-                    )
-
+            cards = standard_cards if height == 1350 else city_cards
+            for card_data in cards:
                 output_path = IMAGE_FOLDER.joinpath(
                     f"{prefix}_motivation_card_{city}_{generator.card_width}_{generator.card_height}_{card_data['date']}.png"
                 )
-                generator.create_motivation_card(
-                    card_data, output_path, INPUT_FOLDER.joinpath(f"{city}_logo.jpeg")
+                tasks.append(
+                    (
+                        generator,
+                        card_data,
+                        output_path,
+                        INPUT_FOLDER.joinpath(f"{city}_logo.jpeg"),
+                    )
                 )
+
+    # Every card is independent, render them on all cores
+    render_motivation_cards(tasks, max_workers)
+
     logger.info("Weekly motivation cards generation completed!")
 
 
@@ -358,7 +432,7 @@ def generate_week_motivation_cards(
     next_monday, next_sunday = get_next_monday(calculation_date)
     for city in cities:
         card_data = {
-            "date": f"{FR_MONTHS[next_monday.strftime('%B')].upper()} \n {next_monday.day} - {next_sunday.day}",
+            "date": f"{FR_MONTHS_UPPER[MONTHS[next_monday.month - 1]]} \n {next_monday.day} - {next_sunday.day}",
             "spanish_text": f"¿Qué hacer en {city.capitalize()} esta semana ?",
             "french_text": f"Quoi faire à {city.capitalize()} cette semaine ?",
             "day_name_fr": "Semaine",
@@ -1,7 +1,12 @@
 import logging
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
-from event_card_generator import EventCardGenerator
+from event_card_generator import (
+    PNG_SAVE_OPTIONS,
+    EventCardGenerator,
+    get_font,
+    render_cards,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,13 +58,19 @@ class MotivationCardGenerator(EventCardGenerator):
         self.weather_margin_top = 50
 
     def add_header(
-        self, card: Image.Image, text_date: str, logo_path: Path, logo_x: int = 75
+        self,
+        card: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        text_date: str,
+        logo_path: Path,
+        logo_x: int = 75,
     ) -> int:
         """
         Add a header with the logo at the top of the card.
 
         Args:
-            card: PIL Image object
+            card: PIL Image object representing the card
+            draw: ImageDraw handle bound to the card
             logo_path: Path to the logo image file
 
         Returns:
@@ -67,26 +78,33 @@ class MotivationCardGenerator(EventCardGenerator):
         """
         # Add brand header and get logo position info
         logo_height = self.load_and_process_image(
-            card, logo_path, self.start_card, content_start_x=logo_x, resize=True
+            card,
+            logo_path,
+            self.start_card,
+            content_start_x=logo_x,
+            resize=True,
         )
 
-        # Add vertical line and date text next to logo
-        logo_img = Image.open(logo_path)
-        logo_width = int(logo_img.width * self.image_resize_ratio)
+        # Add vertical line and date text next to logo, the logo is only
+        # decoded once and shared with load_and_process_image
+        logo_width = self.get_fitted_image(logo_path, resize=True).width
 
         # Add vertical line
         self.add_vertical_line(
-            card, self.start_card, logo_width, logo_x / 2, logo_height
+            card, draw, self.start_card, logo_width, logo_x / 2, logo_height
         )
 
         # Add date text
-        self.add_date_text(card, text_date, self.start_card, logo_width, logo_x / 2)
+        self.add_date_text(
+            card, draw, text_date, self.start_card, logo_width, logo_x / 2
+        )
 
         return logo_height
 
     def add_vertical_line(
         self,
         card: Image.Image,
+        draw: ImageDraw.ImageDraw,
         logo_y: int,
         logo_width: int,
         logo_x: int,
@@ -96,14 +114,13 @@ class MotivationCardGenerator(EventCardGenerator):
         Add a vertical line to the right of the logo.
 
         Args:
-            card: PIL Image object
+            card: PIL Image object representing the card
+            draw: ImageDraw handle bound to the card
             logo_y: Y position of the logo
             logo_width: Width of the logo
             logo_x: X position of the logo
             logo_height: Height of the logo
         """
-        draw = ImageDraw.Draw(card)
-
         # Position vertical line between logo and date
         line_x = logo_x + logo_width + 100
         line_y1 = logo_y
@@ -115,6 +132,7 @@ class MotivationCardGenerator(EventCardGenerator):
     def add_date_text(
         self,
         card: Image.Image,
+        draw: ImageDraw.ImageDraw,
         date_text: str,
         logo_y: int,
         logo_width: int,
@@ -124,7 +142,8 @@ class MotivationCardGenerator(EventCardGenerator):
         Add date text to the right of the vertical line.
 
         Args:
-            card: PIL Image object
+            card: PIL Image object representing the card
+            draw: ImageDraw handle bound to the card
             date_text: Date text to display
             logo_y: Y position of the logo
             logo_width: Width of the logo
@@ -136,9 +155,10 @@ class MotivationCardGenerator(EventCardGenerator):
 
         self.add_event_info(
             card,
+            draw,
             date_text,
             date_y,
-            ImageFont.truetype(self.font_regular, self.date_text_size),
+            get_font(self.font_regular, self.date_text_size),
             x_position=date_x,
         )
 
@@ -149,29 +169,29 @@ class MotivationCardGenerator(EventCardGenerator):
         Add a banner below the header with day names.
 
         Args:
-            card: PIL Image object
+            card: PIL Image object representing the card
             card_data: Dictionary containing card data
 
         Returns:
             Y position after the banner
         """
-        draw = ImageDraw.Draw(card)
         # Draw banner
         banner_start_y = content_start_y + 100
         banner_color = self.get_color(card_data["day_name_fr"])
-        content_start_y = self.draw_banner(draw, banner_start_y, banner_color)
+        content_start_y = self.draw_banner(card, banner_start_y, banner_color)
         # Add banner text
         self.add_banner_text(
             card,
             f"{card_data['day_name_es']} / {card_data['day_name_fr']}",
             banner_start_y,
-            ImageFont.truetype(self.font_bold, self.banner_font_size),
+            get_font(self.font_bold, self.banner_font_size),
         )
         return content_start_y
 
     def draw_rounded_rectangle_banner(
         self,
         card: Image.Image,
+        draw: ImageDraw.ImageDraw,
         text: str,
         y_position: int,
         font_type: ImageFont.FreeTypeFont,
@@ -180,7 +200,8 @@ class MotivationCardGenerator(EventCardGenerator):
         Draw a rounded rectangle banner with black border and card background color.
 
         Args:
-            card: PIL Image object
+            card: PIL Image object representing the card
+            draw: ImageDraw handle bound to the card
             text: Text to display in the rectangle
             y_position: Y position for the rectangle
             font_type: Font to use for the text
@@ -188,8 +209,6 @@ class MotivationCardGenerator(EventCardGenerator):
         Returns:
             Y position after the rectangle banner
         """
-        draw = ImageDraw.Draw(card)
-
         # Calculate text dimensions
         bbox = draw.textbbox((0, 0), text, font=font_type)
         text_width = bbox[2] - bbox[0]
@@ -207,11 +226,10 @@ class MotivationCardGenerator(EventCardGenerator):
         rect_y = y_position
 
         # Draw border
-        self._draw_rounded_rectangle(
-            draw,
+        draw.rounded_rectangle(
             (rect_x, rect_y, rect_x + rect_width, rect_y + rect_height),
-            (0, 0, 0),
-            radius,
+            radius=radius,
+            outline=(0, 0, 0),
             width=3,
         )
 
@@ -219,56 +237,18 @@ class MotivationCardGenerator(EventCardGenerator):
         text_x = rect_x + (rect_width - text_width) // 2
         text_y = rect_y + (rect_height - text_height) // 2
 
-        y_pos = self.add_event_info(card, text, text_y, font_type, x_position=text_x)
+        y_pos = self.add_event_info(
+            card, draw, text, text_y, font_type, x_position=text_x
+        )
 
         return y_pos
 
-    def _draw_rounded_rectangle(self, draw, bbox, outline, radius, width=1):
-        """Draw a rounded rectangle border."""
-        x1, y1, x2, y2 = bbox
-
-        # Draw border lines
-        draw.line(
-            [(x1 + radius, y1), (x2 - radius, y1)], fill=outline, width=width
-        )  # Top
-        draw.line(
-            [(x1 + radius, y2), (x2 - radius, y2)], fill=outline, width=width
-        )  # Bottom
-        draw.line(
-            [(x1, y1 + radius), (x1, y2 - radius)], fill=outline, width=width
-        )  # Left
-        draw.line(
-            [(x2, y1 + radius), (x2, y2 - radius)], fill=outline, width=width
-        )  # Right
-
-        # Draw corner arcs
-        draw.arc(
-            [x1, y1, x1 + radius * 2, y1 + radius * 2],
-            180,
-            270,
-            fill=outline,
-            width=width,
-        )
-        draw.arc(
-            [x2 - radius * 2, y1, x2, y1 + radius * 2],
-            270,
-            360,
-            fill=outline,
-            width=width,
-        )
-        draw.arc(
-            [x1, y2 - radius * 2, x1 + radius * 2, y2],
-            90,
-            180,
-            fill=outline,
-            width=width,
-        )
-        draw.arc(
-            [x2 - radius * 2, y2 - radius * 2, x2, y2], 0, 90, fill=outline, width=width
-        )
-
     def add_content(
-        self, card: Image.Image, card_data: dict[str, str], content_start_y: int
+        self,
+        card: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        card_data: dict[str, str],
+        content_start_y: int,
     ) -> int:
         """Add all event content to the card."""
         y_pos = content_start_y + 150  # Small padding from banner
@@ -276,9 +256,10 @@ class MotivationCardGenerator(EventCardGenerator):
         # Add Spanish text (main message)
         y_pos = self.add_event_info(
             card,
+            draw,
             f"{card_data['spanish_text']} {card_data['emoji']}",
             y_pos,
-            ImageFont.truetype(self.font_bold, self.main_text_size),
+            get_font(self.font_bold, self.main_text_size),
             section_spacing=100,
             split_text=True,
         )
@@ -286,9 +267,10 @@ class MotivationCardGenerator(EventCardGenerator):
         # Add French text in rounded rectangle banner
         y_pos = self.draw_rounded_rectangle_banner(
             card,
+            draw,
             f"{card_data['french_text']} {card_data['emoji']}",
             y_pos,
-            ImageFont.truetype(self.font_regular, self.secondary_text_size),
+            get_font(self.font_regular, self.secondary_text_size),
         )
 
         return y_pos
@@ -305,18 +287,42 @@ class MotivationCardGenerator(EventCardGenerator):
             logo_path: Path to the logo image file
         """
         # Create base card
-        card = Image.new(
-            "RGB", (self.card_width, self.card_height), self.background_color
-        )
+        card = self.create_base_card()
+        # Drawing handle shared by every text helper of the card
+        draw = ImageDraw.Draw(card)
         # Add header
-        logo_height = self.add_header(card, card_data["date"], logo_path)
+        logo_height = self.add_header(card, draw, card_data["date"], logo_path)
 
         # Add banner
         content_start_y = self.add_banner(card, card_data, logo_height)
 
         # Add main message (centered in the middle area)
-        self.add_content(card, card_data, content_start_y)
+        self.add_content(card, draw, card_data, content_start_y)
 
         # Save the card
-        card.save(output_path, quality=95)
+        card.save(output_path, **PNG_SAVE_OPTIONS)
         logger.info(f"✅ Saved motivation card at {output_path}")
+
+
+def _render_motivation_card(
+    task: tuple[EventCardGenerator, dict, Path, Path],
+) -> None:
+    generator, card_data, output_path, logo_path = task
+    generator.create_motivation_card(card_data, output_path, logo_path)
+
+
+def render_motivation_cards(
+    tasks: list[tuple[EventCardGenerator, dict, Path, Path]],
+    max_workers: int | None = None,
+):
+    """
+    Render independent motivation cards in parallel worker processes.
+
+    Works with any generator providing create_motivation_card, story cards
+    included.
+
+    Args:
+        tasks: Generator, card data, output path and logo path per card
+        max_workers: Maximum number of worker processes, defaults to CPU count
+    """
+    render_cards(_render_motivation_card, tasks, max_workers)
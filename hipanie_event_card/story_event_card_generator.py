@@ -1,7 +1,12 @@
 import logging
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from pathlib import Path
-from event_card_generator import EventCardGenerator
+from event_card_generator import (
+    JPEG_SAVE_OPTIONS,
+    EventCardGenerator,
+    get_font,
+    render_gradient_tile,
+)
 
 BASE_DIR = Path(__file__).parent
 IMAGE_FOLDER = BASE_DIR.joinpath("images")
@@ -13,6 +18,9 @@ logger = logging.getLogger(__name__)
 class StoryEventCardGenerator(EventCardGenerator):
     """Story format event card generator (1080x1920) with gradient backgrounds and centered layout."""
 
+    # The event image fills the space left below each card's content
+    FIXED_IMAGE_HEIGHT = False
+
     def __init__(self, width: int = 1080, height: int = 1920):
         """
         Initialize the story format event card generator.
@@ -54,22 +62,14 @@ class StoryEventCardGenerator(EventCardGenerator):
             card: PIL Image object to apply gradient to
             colors: Tuple of two RGB color tuples (top_color, bottom_color)
         """
-        draw = ImageDraw.Draw(card)
-        top_color, bottom_color = colors
-
         # Calculate gradient area height based on ratio
         gradient_height = int(self.card_height * self.gradient_height_ratio)
+        if gradient_height <= 0:
+            return
 
-        for y in range(gradient_height):
-            # Calculate blend ratio within the gradient area
-            ratio = y / gradient_height
-
-            # Interpolate between colors
-            r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-            g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-            b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-
-            draw.line([(0, y), (self.card_width, y)], fill=(r, g, b))
+        card.paste(
+            render_gradient_tile((self.card_width, gradient_height), *colors), (0, 0)
+        )
 
     def get_gradient_colors(
         self, date: str
@@ -86,44 +86,50 @@ class StoryEventCardGenerator(EventCardGenerator):
         """
         return (self.get_color(date), self.background_color)
 
-    def create_event_card(self, event: dict[str, str], output_path: str):
+    def create_event_card(
+        self,
+        event: dict[str, str],
+        output_path: str,
+        image_data: bytes | None = None,
+    ):
         """
         Create a story format event card with gradient background and centered layout.
 
         Args:
             event: Dictionary containing event data
             output_path: Path where the generated card image should be saved
+            image_data: Prefetched bytes of the event image, if available
         """
         # Create base card with white background
-        card = Image.new(
-            "RGB", (self.card_width, self.card_height), self.background_color
-        )
+        card = self.create_base_card()
+        # Drawing handle shared by every text helper of the card
+        draw = ImageDraw.Draw(card)
 
         # Create gradient background
         gradient_colors = self.get_gradient_colors(event["date"])
         self.create_gradient_background(card, gradient_colors)
 
-        draw = ImageDraw.Draw(card)
-
         # Draw rectangular banner
         banner_color = self.get_color(event["date"])
-        content_start_y = self.draw_banner(draw, self.start_card, banner_color)
+        content_start_y = self.draw_banner(card, self.start_card, banner_color)
 
         # Add banner text
         self.add_banner_text(
             card,
             event["date"],
             self.start_card,
-            ImageFont.truetype(self.font_bold, self.banner_font_size),
+            get_font(self.font_bold, self.banner_font_size),
         )
 
         # Add story content
-        content_end_y = self.add_content(card, event, content_start_y)
+        content_end_y = self.add_content(card, draw, event, content_start_y)
 
         # Load and process event image (smaller for story format)
         self.max_crop_height = (self.card_height - 20) - (content_end_y + 20)
-        self.load_and_process_image(card, event["image"], content_end_y + 20)
+        self.load_and_process_image(
+            card, event["image"], content_end_y + 20, image_data=image_data
+        )
 
         # Save the card
-        card.save(output_path, quality=95)
+        card.save(output_path, **JPEG_SAVE_OPTIONS)
         logger.info(f"✅ Saved story card at {output_path}")
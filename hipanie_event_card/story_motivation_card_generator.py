@@ -1,6 +1,7 @@
 import logging
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 from pathlib import Path
+from event_card_generator import PNG_SAVE_OPTIONS, get_font
 from story_event_card_generator import StoryEventCardGenerator
 
 logger = logging.getLogger(__name__)
@@ -51,24 +52,30 @@ class StoryMotivationCardGenerator(StoryEventCardGenerator):
         self.weather_margin_top = 50
 
     def add_content(
-        self, card: Image.Image, card_data: dict[str, str], content_start_y: int
+        self,
+        card: Image.Image,
+        draw: ImageDraw.ImageDraw,
+        card_data: dict[str, str],
+        content_start_y: int,
     ) -> int:
         """Add all event content to the card."""
         y_pos = content_start_y + 200  # Small padding from banner
 
         y_pos = self.add_event_info(
             card,
+            draw,
             f"{card_data['spanish_text']} {card_data['emoji']}",
             y_pos,
-            ImageFont.truetype(self.font_bold, self.main_text_size),
+            get_font(self.font_bold, self.main_text_size),
             section_spacing=2000,
             split_text=True,
         )
         y_pos = self.add_event_info(
             card,
+            draw,
             f"{card_data['french_text']} {card_data['emoji']}",
             y_pos,
-            ImageFont.truetype(self.font_regular, self.secondary_text_size),
+            get_font(self.font_regular, self.secondary_text_size),
             section_spacing=500,
             split_text=True,
         )
@@ -87,9 +94,9 @@ class StoryMotivationCardGenerator(StoryEventCardGenerator):
             logo_path: Path to the logo image file
         """
         # Create base card
-        card = Image.new(
-            "RGB", (self.card_width, self.card_height), self.background_color
-        )
+        card = self.create_base_card()
+        # Drawing handle shared by every text helper of the card
+        draw = ImageDraw.Draw(card)
 
         # Create gradient background
         gradient_colors = self.get_gradient_colors(card_data["day_name_fr"])
@@ -101,39 +108,39 @@ class StoryMotivationCardGenerator(StoryEventCardGenerator):
             weather_data = card_data["weather"]
             y_pos = self.add_event_info(
                 card,
+                draw,
                 f"{weather_data['emoji']} {weather_data['temperature']}°C - {weather_data['description']}",
                 y_pos,
-                ImageFont.truetype(self.font_regular, self.weather_text_size),
+                get_font(self.font_regular, self.weather_text_size),
                 section_spacing=100,
             )
 
         y_pos = self.add_event_info(
             card,
+            draw,
             card_data["date"],
             y_pos,
-            ImageFont.truetype(self.font_regular, self.date_text_size),
+            get_font(self.font_regular, self.date_text_size),
         )
 
-        draw = ImageDraw.Draw(card)
-
         # Draw inclined banner
         banner_start_y = y_pos
         banner_color = self.get_color(card_data["day_name_fr"])
-        content_start_y = self.draw_banner(draw, banner_start_y, banner_color)
+        content_start_y = self.draw_banner(card, banner_start_y, banner_color)
         # Add banner text
         self.add_banner_text(
             card,
             f"{card_data['day_name_es']} / {card_data['day_name_fr']} >",
             banner_start_y,
-            ImageFont.truetype(self.font_bold, self.banner_font_size),
+            get_font(self.font_bold, self.banner_font_size),
         )
 
         # Add main message (centered in the middle area)
-        self.add_content(card, card_data, content_start_y)
+        self.add_content(card, draw, card_data, content_start_y)
 
         # Add brand footer
         self.load_and_process_image(card, logo_path, self.card_height - 400)
 
         # Save the card
-        card.save(output_path, quality=95)
+        card.save(output_path, **PNG_SAVE_OPTIONS)
         logger.info(f"✅ Saved motivation card at {output_path}")
@@ -1,7 +1,8 @@
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,26 @@ class WeatherService:
             logger.error(f"Error fetching weather for {city}: {e}")
             return None
 
+    def get_weather_for_cities(
+        self, city_dates: Iterable[tuple[str, datetime]], max_workers: int = 8
+    ) -> Dict[tuple[str, datetime], Optional[Dict]]:
+        """
+        Get weather data for several cities and dates concurrently.
+
+        Args:
+            city_dates: (city, date) pairs to fetch, as for get_weather_for_city
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Dictionary mapping each (city, date) pair to its weather data or None
+        """
+        city_dates = list(dict.fromkeys(city_dates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            weather = executor.map(
+                lambda city_date: self.get_weather_for_city(*city_date), city_dates
+            )
+            return dict(zip(city_dates, weather))
+
     def _get_current_weather(self, city: str) -> Optional[Dict]:
         """Get current weather for city."""
         url = f"{self.base_url}/weather"
@@ -0,0 +1,195 @@
+import random
+
+import pytest
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageStat
+from pilmoji.helpers import to_nodes
+
+import event_card_generator
+from event_card_generator import (
+    EventCardGenerator,
+    get_font,
+    load_fitted_image,
+    parse_text,
+    render_text_tile,
+)
+
+FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+WORDS = (
+    "Soirée salsa bachata kizomba au bord de la Loire avec DJ invité, cours "
+    "d'initiation gratuit pour les débutants puis social jusqu'à deux heures "
+    "du matin, entrée libre avant vingt-deux heures et tapas maison"
+).split()
+
+
+@pytest.fixture(autouse=True)
+def clear_image_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        event_card_generator, "IMAGE_CACHE_FOLDER", tmp_path.joinpath("cache")
+    )
+    event_card_generator._fitted_images.clear()
+    yield
+    event_card_generator._fitted_images.clear()
+
+
+def greedy_wrap(paragraph, font, max_width):
+    lines = []
+    current = ""
+    for word in paragraph.split():
+        candidate = f"{current} {word}" if current else word
+        if font.getlength(candidate) <= max_width:
+            current = candidate
+        else:
+            if current:
+                lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+    return lines
+
+
+def save_jpeg(path, size):
+    img = Image.linear_gradient("L").resize(size).convert("RGB")
+    img.save(path, "JPEG", quality=95)
+    return path
+
+
+def test_wrap_paragraph_matches_greedy_wrap():
+    font = get_font(FONT_PATH, 30)
+    rng = random.Random(1)
+    for _ in range(200):
+        paragraph = " ".join(rng.choices(WORDS, k=rng.randint(1, 60)))
+        max_width = rng.randint(150, 1000)
+        assert EventCardGenerator._wrap_paragraph(
+            paragraph, font, max_width
+        ) == greedy_wrap(paragraph, font, max_width)
+
+
+def test_wrap_paragraph_stops_at_max_lines():
+    font = get_font(FONT_PATH, 30)
+    paragraph = " ".join(WORDS)
+    lines = EventCardGenerator._wrap_paragraph(paragraph, font, 300, max_lines=2)
+    assert lines == greedy_wrap(paragraph, font, 300)[:2]
+
+
+def test_add_event_info_only_caches_repeated_text():
+    generator = EventCardGenerator()
+    card = generator.create_base_card()
+    draw = ImageDraw.Draw(card)
+    font = get_font(FONT_PATH, 30)
+    render_text_tile.cache_clear()
+
+    generator.add_event_info(card, draw, "Soirée unique", 100, font)
+    assert render_text_tile.cache_info().currsize == 0
+
+    generator.add_event_info(card, draw, "10€", 200, font, cache_tile=True)
+    generator.add_event_info(card, draw, "10€", 300, font, cache_tile=True)
+    assert render_text_tile.cache_info().currsize == 1
+    assert render_text_tile.cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    ("date", "expected"),
+    [
+        ("Vendredi 3 octobre", (244, 67, 54)),
+        ("Tous les jeudis", (156, 39, 176)),
+        ("Todos los sábados", (76, 175, 80)),
+        ("Todos los sabados", (76, 175, 80)),
+        ("Miércoles 5", (204, 153, 0)),
+        ("MARDI12", (33, 150, 243)),
+        ("Vendredi et lundi", (255, 152, 0)),
+        ("Sans date", (255, 152, 0)),
+    ],
+)
+def test_get_color_matches_day_names(date, expected):
+    assert EventCardGenerator().get_color(date) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Cours de salsa",
+        "🎉 Soirée latine",
+        "📍 Le Ferrailleur, Nantes",
+        "Première ligne\nDeuxième ligne",
+        "Ligne\n\nvide",
+        "Prix: 10€ © 2025",
+        "❤️ Concert 🎶🔥",
+        "",
+    ],
+)
+def test_parse_text_matches_to_nodes(text):
+    assert parse_text(text) == to_nodes(text)
+
+
+@pytest.mark.parametrize(
+    ("size", "kwargs", "expected"),
+    [
+        ((2000, 1500), {}, (1000, 750)),
+        ((2000, 1500), {"max_height": 300}, (1000, 300)),
+        ((800, 600), {}, (800, 600)),
+        ((800, 600), {"max_height": 400}, (800, 400)),
+        ((800, 600), {"resize_ratio": 0.5}, (400, 300)),
+    ],
+)
+def test_load_fitted_image_size(tmp_path, size, kwargs, expected):
+    image_path = save_jpeg(tmp_path.joinpath("image.jpg"), size)
+    assert load_fitted_image(str(image_path), 1000, **kwargs).size == expected
+
+
+def test_load_fitted_image_reuses_disk_cache(tmp_path, monkeypatch):
+    image_data = save_jpeg(tmp_path.joinpath("image.jpg"), (2000, 1500)).read_bytes()
+    downloads = []
+
+    def download_image(url):
+        downloads.append(url)
+        return image_data
+
+    monkeypatch.setattr(event_card_generator, "download_image", download_image)
+    url = "https://example.com/image.jpg"
+
+    first = load_fitted_image(url, 1000, max_height=500)
+    event_card_generator._fitted_images.clear()
+    second = load_fitted_image(url, 1000, max_height=500)
+
+    assert downloads == [url]
+    assert first.size == second.size == (1000, 500)
+    assert first.tobytes() == second.tobytes()
+
+
+def test_load_fitted_image_in_memory_cache(tmp_path):
+    image_path = str(save_jpeg(tmp_path.joinpath("image.jpg"), (2000, 1500)))
+    image_data = tmp_path.joinpath("image.jpg").read_bytes()
+
+    first = load_fitted_image(image_path, 1000, image_data=image_data)
+    assert load_fitted_image(image_path, 1000) is first
+    # Only the path and sizing are kept as key, never the downloaded bytes
+    assert all(
+        not isinstance(part, bytes)
+        for key in event_card_generator._fitted_images
+        for part in key
+    )
+
+
+def test_load_fitted_image_draft_matches_full_decode(tmp_path):
+    # Blurred noise with sharp edges, detail a coarse DCT draft would lose
+    source = Image.merge(
+        "RGB",
+        [
+            Image.effect_noise((2400, 3200), 60).filter(ImageFilter.GaussianBlur(2))
+            for _ in range(3)
+        ],
+    )
+    draw = ImageDraw.Draw(source)
+    for x in range(0, 2400, 40):
+        draw.line([(x, 0), (2400 - x, 3200)], fill="white", width=3)
+    image_path = tmp_path.joinpath("image.jpg")
+    source.save(image_path, "JPEG", quality=95)
+
+    fitted = load_fitted_image(str(image_path), 600, max_height=400)
+    with Image.open(image_path) as img:
+        expected = img.convert("RGB").resize(
+            (600, 400), Image.Resampling.LANCZOS, (0, 0, 2400, 1600)
+        )
+
+    assert fitted.size == (600, 400)
+    assert max(ImageStat.Stat(ImageChops.difference(fitted, expected)).mean) < 1.5
@@ -0,0 +1,51 @@
+import find_common_events
+from find_common_events import EventMerger
+
+
+def test_filter_non_common_events_keeps_duplicates_and_order():
+    merger = EventMerger()
+    events_non_detailed = [
+        {"link": "b", "title": "1"},
+        {"link": "a", "title": "2"},
+        {"title": "3"},
+        {"link": " b ", "title": "4"},
+        {"link": "not found", "title": "5"},
+        {"link": "c", "title": "6"},
+        {"link": "a ", "title": "7"},
+    ]
+    events_detailed = [{"link": "a", "title": "A"}]
+
+    non_detailed_link_map, detailed_link_map, non_detailed_links = (
+        merger.create_link_maps(events_non_detailed, events_detailed)
+    )
+    common_links = merger.find_common_links(non_detailed_link_map, detailed_link_map)
+    non_common_events = merger.filter_non_common_events(
+        events_non_detailed, non_detailed_links, common_links
+    )
+
+    assert common_links == {"a"}
+    assert [event["title"] for event in non_common_events] == ["1", "3", "4", "5", "6"]
+
+
+def test_merge_common_events_overwrites_found_fields():
+    merger = EventMerger()
+    non_detailed_link_map = {"a": {"link": "a", "title": "Old", "cost": "10€"}}
+    detailed_link_map = {"a": {"link": "a", "title": " New ", "cost": "not found"}}
+
+    merged = merger.merge_common_events(non_detailed_link_map, detailed_link_map, {"a"})
+
+    assert merged == [{"link": "a", "title": "New", "cost": "10€"}]
+
+
+def test_save_events_to_file_layout_does_not_depend_on_orjson(tmp_path, monkeypatch):
+    events = [{"title": "Soirée 🎉", "cost": "10€", "tags": [], "price": 1.5}]
+    merger = EventMerger()
+
+    merger.save_events_to_file(events, tmp_path.joinpath("fast.json"), "created")
+    monkeypatch.setattr(find_common_events, "orjson", None)
+    merger.save_events_to_file(events, tmp_path.joinpath("stdlib.json"), "created")
+
+    assert (
+        tmp_path.joinpath("fast.json").read_bytes()
+        == tmp_path.joinpath("stdlib.json").read_bytes()
+    )